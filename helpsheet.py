@@ -6,8 +6,94 @@ Each section includes detailed explanations and practical examples.
 """
 
 import sqlite3
+import sys
 from datetime import datetime
 
+# Reusable SQL for the examples below.
+# sqlite3 keeps a cache of prepared statements keyed by the SQL text, so
+# running text that is character-for-character the same as before skips
+# re-parsing it - whether it comes from a constant or is typed out again.
+# Any difference (an extra space, another line break) counts as new SQL.
+# Keeping each query in one constant simply makes it easy to be sure the
+# text never changes. SQL built with an f-string is cached the same way,
+# but every distinct result is a separate entry (see the multi-row
+# INSERT in Section 3, whose text depends on how many rows it inserts).
+SQL_ALL_STUDENTS = 'SELECT * FROM students'
+SQL_NAMES_AND_GPAS = 'SELECT name, gpa FROM students'
+SQL_GPA_GT = 'SELECT name, gpa FROM students WHERE gpa > ?'
+SQL_AGE_EQ_GPA_GT = 'SELECT name, age, gpa FROM students WHERE age = ? AND gpa > ?'
+SQL_EMAIL_LIKE = 'SELECT name, email FROM students WHERE email LIKE ?'
+SQL_BY_GPA_DESC = 'SELECT name, gpa FROM students ORDER BY gpa DESC'
+SQL_GPA_STATS = '''
+SELECT 
+    COUNT(*) as total_students,
+    AVG(gpa) as average_gpa,
+    MAX(gpa) as highest_gpa,
+    MIN(gpa) as lowest_gpa
+FROM students
+'''
+SQL_COUNT_BY_AGE = '''
+SELECT age, COUNT(*) as student_count
+FROM students
+GROUP BY age
+ORDER BY age
+'''
+
+# Section 3, also reused in Sections 6 and 11
+SQL_INSERT_STUDENT = 'INSERT INTO students (name, email, age, gpa) VALUES (?, ?, ?, ?)'
+SQL_INSERT_STUDENT_NAMED = '''
+INSERT INTO students (name, email, age, gpa)
+VALUES (:name, :email, :age, :gpa)
+'''
+
+# Sections 5 and 6
+SQL_SET_GPA_BY_NAME = 'UPDATE students SET gpa = ? WHERE name = ?'
+SQL_RAISE_GPA_AGE_GT = 'UPDATE students SET gpa = gpa + 0.1 WHERE age > ?'
+SQL_AGE_GT = 'SELECT name, age, gpa FROM students WHERE age > ?'
+SQL_DELETE_BY_NAME = 'DELETE FROM students WHERE name = ?'
+SQL_DELETE_GPA_LT = 'DELETE FROM students WHERE gpa < ?'
+
+# Section 7
+SQL_FIRST_TWO_STUDENTS = 'SELECT * FROM students LIMIT 2'
+
+# Section 8
+SQL_GPA_BY_NAMES = 'SELECT name, gpa FROM students WHERE name IN (?, ?)'
+SQL_TRANSFER_GPA = '''
+UPDATE students
+SET gpa = gpa + CASE name WHEN :giver THEN -:amount
+                          WHEN :receiver THEN :amount END
+WHERE name IN (:giver, :receiver)
+'''
+
+# Section 9
+SQL_COURSES_INNER_JOIN = '''
+SELECT students.name, courses.course_name, courses.grade
+FROM students
+INNER JOIN courses ON students.id = courses.student_id
+'''
+SQL_COURSES_LEFT_JOIN = '''
+SELECT students.name, courses.course_name, courses.grade
+FROM students
+LEFT JOIN courses ON students.id = courses.student_id
+'''
+
+# Section 10
+SQL_LIST_TABLES = "SELECT name FROM sqlite_master WHERE type='table'"
+SQL_TABLE_INFO = '''
+SELECT cid, name, type, "notnull", dflt_value, pk
+FROM pragma_table_info(?)
+'''
+
+# Sections 11 and 12
+SQL_STUDENTS_AGE_EQ = 'SELECT * FROM students WHERE age = ?'
+SQL_COUNT_STUDENTS = 'SELECT COUNT(*) FROM students'
+
+# Most ? placeholders one statement may use. SQLite before 3.32 allows
+# 999; newer versions allow more, so 999 is the safe choice. The
+# multi-row INSERTs in Sections 3 and 9 divide this by their column count
+# to get how many rows fit in one statement.
+MAX_VARIABLES = 999
+
 # =============================================================================
 # SECTION 1: CONNECTING TO A DATABASE
 # =============================================================================
@@ -20,10 +106,47 @@ print("=" * 70)
 # - No separate server needed - it's built into Python!
 # - Perfect for small to medium applications
 
+
+def _configure(conn):
+    """Apply the performance PRAGMAs used throughout this tutorial."""
+    conn.executescript('''
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+    ''')
+
+
 # Connect to a database file (creates the file if it doesn't exist)
-connection = sqlite3.connect('my_database.db')
+# cached_statements raises the prepared-statement cache size (default 128)
+# Autocommit mode turns off Python's hidden transaction handling:
+# each statement is saved on its own unless WE start a transaction with
+# BEGIN. Transactions are then always explicit (see Sections 3, 8 and 9),
+# and sqlite3 no longer checks "should I open a transaction?" on every
+# execute(). Python 3.12+ spells this autocommit=True; older versions
+# use isolation_level=None.
+if sys.version_info >= (3, 12):
+    autocommit_mode = {'autocommit': True}
+else:
+    autocommit_mode = {'isolation_level': None}
+connection = sqlite3.connect('my_database.db', cached_statements=256,
+                             **autocommit_mode)
+_configure(connection)
 print("✓ Connected to database 'my_database.db'")
 
+# What do those PRAGMAs do?
+# - journal_mode = WAL: writes go to a separate log file, so readers don't
+#   block writers
+# - synchronous = NORMAL: with WAL, a commit does NOT wait for the disk at
+#   all - the log is only flushed (fsync) at checkpoints, when it is
+#   copied back into the database file. The cost: a transaction committed
+#   just before a power loss or OS crash can be lost (the database itself
+#   stays intact, and an app crash alone loses nothing).
+# - temp_store = MEMORY: temporary tables/indexes live in RAM
+# - cache_size = -64000: keep up to ~64 MB of pages in memory
+# - mmap_size: read the database file through memory mapping
+
 # What is a cursor?
 # - Think of it as a pointer that executes SQL commands
 # - You need a cursor to run queries and get results
@@ -43,12 +166,10 @@ print("=" * 70)
 print("SECTION 2: CREATING TABLES")
 print("=" * 70)
 
-# Drop existing table if it exists (for clean start)
-cursor.execute('DROP TABLE IF EXISTS students')
-
 # Create a table with different data types
+# IF NOT EXISTS makes this safe to run again on an existing database
 cursor.execute('''
-CREATE TABLE students (
+CREATE TABLE IF NOT EXISTS students (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
     email TEXT UNIQUE,
@@ -58,6 +179,14 @@ CREATE TABLE students (
 )
 ''')
 
+# Empty the table for a clean start. A DELETE with no WHERE clause is
+# optimized by SQLite into a quick "truncate", which is much cheaper than
+# DROP TABLE + CREATE TABLE (that changes the schema, which forces every
+# cached prepared statement to be re-prepared on its next use). Resetting sqlite_sequence restarts
+# the AUTOINCREMENT ids at 1.
+cursor.execute('DELETE FROM students')
+cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'students'")
+
 # Let's break down the table structure:
 # - id: Auto-incrementing number (1, 2, 3, ...) - PRIMARY KEY means unique identifier
 # - name: TEXT type - stores strings (NOT NULL means it's required)
@@ -68,9 +197,22 @@ CREATE TABLE students (
 
 print("✓ Table 'students' created with columns: id, name, email, age, gpa, enrolled")
 
-# IMPORTANT: commit() saves your changes to the database
-connection.commit()
-print("✓ Changes saved (committed) to database")
+# Saving changes: with Python's default transaction handling you must
+# call connection.commit() to save your changes. This connection is in
+# autocommit mode, so the CREATE above was saved as soon as it ran, and
+# connection.commit() is a no-op here. A transaction you open yourself
+# with BEGIN must be ended with COMMIT (see Section 3).
+print("✓ Changes saved (autocommit mode saves each statement as it runs)")
+
+# Indexes let SQLite jump straight to matching rows instead of scanning
+# the whole table. These cover the WHERE / ORDER BY / GROUP BY columns
+# used in Section 4. (email needs no extra index: its UNIQUE constraint
+# already makes SQLite build one automatically.)
+cursor.executescript('''
+CREATE INDEX IF NOT EXISTS idx_students_gpa ON students(gpa);
+CREATE INDEX IF NOT EXISTS idx_students_age ON students(age);
+''')
+print("✓ Indexes created on gpa and age")
 
 print()
 
@@ -81,12 +223,21 @@ print("=" * 70)
 print("SECTION 3: INSERTING DATA")
 print("=" * 70)
 
+# Group all the inserts below into ONE explicit transaction.
+# Without it, every statement is its own transaction: SQLite takes the
+# write lock, writes the changes to the log as a commit, and releases the
+# lock - once per statement. With BEGIN ... COMMIT that work happens once
+# for the whole group.
+# With the default rollback journal (or synchronous = FULL), each commit
+# also waits for the disk to finish writing (an fsync), so batching saves
+# one slow disk flush per statement too. Our connection uses WAL with
+# synchronous = NORMAL (Section 1), where commits don't flush at all, so
+# here the savings come from fewer lock-and-commit rounds.
+cursor.execute('BEGIN')
+
 # Method 1: Insert one row using ? placeholders
 # The ? prevents SQL injection attacks - ALWAYS use placeholders!
-cursor.execute('''
-INSERT INTO students (name, email, age, gpa)
-VALUES (?, ?, ?, ?)
-''', ('Alice Johnson', 'alice@email.com', 20, 3.8))
+cursor.execute(SQL_INSERT_STUDENT, ('Alice Johnson', 'alice@email.com', 20, 3.8))
 print("✓ Inserted: Alice Johnson")
 
 # Method 2: Insert multiple rows at once (faster!)
@@ -97,25 +248,41 @@ students_list = [
     ('Eve Davis', 'eve@email.com', 20, 3.7)
 ]
 
-cursor.executemany('''
-INSERT INTO students (name, email, age, gpa)
-VALUES (?, ?, ?, ?)
-''', students_list)
-print(f"✓ Inserted {len(students_list)} students using executemany()")
+# executemany() would run the INSERT once per row. Instead, build ONE
+# INSERT with a (?, ?, ?, ?) group per row, so SQLite adds them all in a
+# single statement: INSERT ... VALUES (?, ?, ?, ?), (?, ?, ?, ?), ...
+# Rows are sent in batches small enough that rows x columns stays under
+# SQLite's limit on ? placeholders in one statement (MAX_VARIABLES).
+# (The f-string only inserts the table/column names written in this file
+# and ? markers - the values themselves are still passed as params.)
+def insert_many(cursor, table, columns, rows):
+    """Insert rows into table using multi-row INSERT statements."""
+    batch_size = MAX_VARIABLES // len(columns)
+    group = '(' + ', '.join(['?'] * len(columns)) + ')'
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        placeholders = ', '.join([group] * len(batch))
+        params = tuple(value for row in batch for value in row)
+        cursor.execute(f'''
+        INSERT INTO {table} ({', '.join(columns)})
+        VALUES {placeholders}
+        ''', params)
+
+
+insert_many(cursor, 'students', ('name', 'email', 'age', 'gpa'), students_list)
+print(f"✓ Inserted {len(students_list)} students using one multi-row INSERT")
 
 # Method 3: Named placeholders (more readable for complex queries)
-cursor.execute('''
-INSERT INTO students (name, email, age, gpa)
-VALUES (:name, :email, :age, :gpa)
-''', {'name': 'Frank Miller', 'email': 'frank@email.com', 'age': 22, 'gpa': 3.6})
+cursor.execute(SQL_INSERT_STUDENT_NAMED, {'name': 'Frank Miller', 'email': 'frank@email.com', 'age': 22, 'gpa': 3.6})
 print("✓ Inserted: Frank Miller (using named placeholders)")
 
 # Get the ID of the last inserted row
 print(f"✓ Last inserted student ID: {cursor.lastrowid}")
 
-# Don't forget to commit!
-connection.commit()
-print("✓ All insertions saved to database")
+# Don't forget to commit! (one COMMIT ends the transaction opened above;
+# in autocommit mode we end it with SQL, just like we started it)
+cursor.execute('COMMIT')
+print("✓ All insertions saved to database in a single transaction")
 
 print()
 
@@ -128,93 +295,71 @@ print("=" * 70)
 
 # Query 1: Get ALL rows and ALL columns
 print("\n--- All Students ---")
-cursor.execute('SELECT * FROM students')
-all_students = cursor.fetchall()  # fetchall() returns a list of tuples
-
-for student in all_students:
-    print(student)
+# Looping over the cursor streams rows one at a time as SQLite produces
+# them. fetchall() would first load EVERY row into a list in memory -
+# fine for a handful of rows, wasteful for thousands.
+# The formatted lines are joined and written in ONE sys.stdout.write()
+# call rather than one print() per row, which matters for big results
+# (especially when output is redirected to a file or pipe).
+sys.stdout.write(''.join(f"{student}\n" for student in cursor.execute(SQL_ALL_STUDENTS)))
 
 # Query 2: Get specific columns only
 print("\n--- Names and GPAs Only ---")
-cursor.execute('SELECT name, gpa FROM students')
-names_and_gpas = cursor.fetchall()
-
-for name, gpa in names_and_gpas:
-    print(f"{name}: GPA {gpa}")
+sys.stdout.write(''.join(f"{name}: GPA {gpa}\n"
+                         for name, gpa in cursor.execute(SQL_NAMES_AND_GPAS)))
 
 # Query 3: Get ONE row only
 print("\n--- First Student ---")
-cursor.execute('SELECT * FROM students')
+cursor.execute(SQL_ALL_STUDENTS)
 first_student = cursor.fetchone()  # fetchone() returns a single tuple
 print(first_student)
 
 # Query 4: Get limited number of rows
 print("\n--- First 3 Students ---")
-cursor.execute('SELECT * FROM students')
+cursor.execute(SQL_ALL_STUDENTS)
 three_students = cursor.fetchmany(3)  # fetchmany(n) returns n rows
-for student in three_students:
-    print(student)
+sys.stdout.write(''.join(f"{student}\n" for student in three_students))
 
 # Query 5: Filtering with WHERE clause
 print("\n--- Students with GPA > 3.5 ---")
-cursor.execute('SELECT name, gpa FROM students WHERE gpa > ?', (3.5,))
-high_gpa_students = cursor.fetchall()
-
-for name, gpa in high_gpa_students:
-    print(f"{name}: {gpa}")
+sys.stdout.write(''.join(f"{name}: {gpa}\n"
+                         for name, gpa in cursor.execute(SQL_GPA_GT, (3.5,))))
 
 # Query 6: Multiple conditions with AND/OR
 print("\n--- Students: age 20 AND gpa > 3.5 ---")
-cursor.execute('SELECT name, age, gpa FROM students WHERE age = ? AND gpa > ?', (20, 3.5))
-filtered_students = cursor.fetchall()
-
-for student in filtered_students:
-    print(student)
+sys.stdout.write(''.join(f"{student}\n"
+                         for student in cursor.execute(SQL_AGE_EQ_GPA_GT, (20, 3.5))))
 
 # Query 7: Pattern matching with LIKE
 print("\n--- Students with 'email.com' address ---")
-cursor.execute("SELECT name, email FROM students WHERE email LIKE ?", ('%email.com',))
 # % is a wildcard: %email.com matches anything ending with email.com
-
-for name, email in cursor.fetchall():
-    print(f"{name}: {email}")
+sys.stdout.write(''.join(f"{name}: {email}\n"
+                         for name, email in cursor.execute(SQL_EMAIL_LIKE, ('%email.com',))))
 
 # Query 8: Sorting with ORDER BY
 print("\n--- Students Sorted by GPA (Highest First) ---")
-cursor.execute('SELECT name, gpa FROM students ORDER BY gpa DESC')
 # DESC = descending (high to low), ASC = ascending (low to high)
-
-for name, gpa in cursor.fetchall():
-    print(f"{name}: {gpa}")
+sys.stdout.write(''.join(f"{name}: {gpa}\n"
+                         for name, gpa in cursor.execute(SQL_BY_GPA_DESC)))
 
 # Query 9: Using aggregate functions
 print("\n--- Statistics ---")
-cursor.execute('''
-SELECT 
-    COUNT(*) as total_students,
-    AVG(gpa) as average_gpa,
-    MAX(gpa) as highest_gpa,
-    MIN(gpa) as lowest_gpa
-FROM students
-''')
+# sqlite3.Row on this cursor lets us read the result by the AS names
+# (see Section 7 for more on row factories)
+cursor.row_factory = sqlite3.Row
+cursor.execute(SQL_GPA_STATS)
 stats = cursor.fetchone()
-print(f"Total Students: {stats[0]}")
-print(f"Average GPA: {stats[1]:.2f}")
-print(f"Highest GPA: {stats[2]}")
-print(f"Lowest GPA: {stats[3]}")
+cursor.row_factory = None  # back to plain tuples
+print(f"Total Students: {stats['total_students']}")
+print(f"Average GPA: {stats['average_gpa']:.2f}")
+print(f"Highest GPA: {stats['highest_gpa']}")
+print(f"Lowest GPA: {stats['lowest_gpa']}")
 
 # Query 10: Grouping data
 print("\n--- Count Students by Age ---")
-cursor.execute('''
-SELECT age, COUNT(*) as student_count
-FROM students
-GROUP BY age
-ORDER BY age
-''')
 # GROUP BY combines rows with the same value
-
-for age, count in cursor.fetchall():
-    print(f"Age {age}: {count} student(s)")
+sys.stdout.write(''.join(f"Age {age}: {count} student(s)\n"
+                         for age, count in cursor.execute(SQL_COUNT_BY_AGE)))
 
 print()
 
@@ -227,32 +372,24 @@ print("=" * 70)
 
 # Update one student's GPA
 print("\n--- Updating Bob's GPA ---")
-cursor.execute('''
-UPDATE students 
-SET gpa = ? 
-WHERE name = ?
-''', (3.9, 'Bob Smith'))
+cursor.execute(SQL_SET_GPA_BY_NAME, (3.9, 'Bob Smith'))
 
 print(f"✓ Updated {cursor.rowcount} row(s)")
 # cursor.rowcount tells you how many rows were affected
 
 # Update multiple students at once
 print("\n--- Increasing GPA by 0.1 for students over 22 ---")
-cursor.execute('''
-UPDATE students 
-SET gpa = gpa + 0.1 
-WHERE age > ?
-''', (22,))
+cursor.execute(SQL_RAISE_GPA_AGE_GT, (22,))
 
 print(f"✓ Updated {cursor.rowcount} row(s)")
 
 # Verify the changes
-cursor.execute('SELECT name, age, gpa FROM students WHERE age > 22')
+cursor.execute(SQL_AGE_GT, (22,))
 print("Students over 22:")
 for student in cursor.fetchall():
     print(student)
 
-connection.commit()
+# No commit() needed: in autocommit mode each UPDATE was saved as it ran
 print("\n✓ Updates saved to database")
 
 print()
@@ -265,23 +402,19 @@ print("SECTION 6: DELETING DATA")
 print("=" * 70)
 
 # Insert a test student to delete
-cursor.execute('''
-INSERT INTO students (name, email, age, gpa)
-VALUES (?, ?, ?, ?)
-''', ('Test Student', 'test@email.com', 19, 2.5))
-connection.commit()
+cursor.execute(SQL_INSERT_STUDENT, ('Test Student', 'test@email.com', 19, 2.5))
 
 # Delete specific row
 print("\n--- Deleting Test Student ---")
-cursor.execute('DELETE FROM students WHERE name = ?', ('Test Student',))
+cursor.execute(SQL_DELETE_BY_NAME, ('Test Student',))
 print(f"✓ Deleted {cursor.rowcount} row(s)")
 
 # Delete multiple rows with condition
 print("\n--- Deleting students with GPA < 3.0 ---")
-cursor.execute('DELETE FROM students WHERE gpa < ?', (3.0,))
+cursor.execute(SQL_DELETE_GPA_LT, (3.0,))
 print(f"✓ Deleted {cursor.rowcount} row(s)")
 
-connection.commit()
+# Already saved - each DELETE ran in autocommit mode
 print("✓ Deletions saved to database")
 
 # WARNING: DELETE without WHERE deletes ALL rows!
@@ -299,10 +432,12 @@ print("=" * 70)
 # By default, rows are returned as tuples
 # With Row factory, you can access columns by name like a dictionary
 
-connection.row_factory = sqlite3.Row  # Enable dictionary-like access
-cursor = connection.cursor()  # Create new cursor with row factory
+# Set it on the cursor we already have - no need to create a new one.
+# (connection.row_factory = sqlite3.Row also works, but only applies to
+# cursors created AFTER it is set.)
+cursor.row_factory = sqlite3.Row  # Enable dictionary-like access
 
-cursor.execute('SELECT * FROM students LIMIT 2')
+cursor.execute(SQL_FIRST_TWO_STUDENTS)
 students = cursor.fetchall()
 
 print("\n--- Students as Dictionaries ---")
@@ -321,8 +456,7 @@ student_dict = dict(student)
 print(f"As dict: {student_dict}")
 
 # Reset to normal tuples
-connection.row_factory = None
-cursor = connection.cursor()
+cursor.row_factory = None
 
 print()
 
@@ -339,34 +473,34 @@ print("=" * 70)
 
 print("\n--- Transaction Example: Transfer GPA Points ---")
 print("Before: ")
-cursor.execute('SELECT name, gpa FROM students WHERE name IN (?, ?)', 
-               ('Alice Johnson', 'Bob Smith'))
+cursor.execute(SQL_GPA_BY_NAMES, ('Alice Johnson', 'Bob Smith'))
 for student in cursor.fetchall():
     print(f"  {student[0]}: {student[1]}")
 
 try:
-    # Start transaction (happens automatically with execute)
-    # Take 0.2 from Alice
-    cursor.execute('UPDATE students SET gpa = gpa - 0.2 WHERE name = ?', 
-                   ('Alice Johnson',))
-    
-    # Give 0.2 to Bob
-    cursor.execute('UPDATE students SET gpa = gpa + 0.2 WHERE name = ?', 
-                   ('Bob Smith',))
+    # Start the transaction explicitly. IMMEDIATE grabs the write lock
+    # right away, so another connection can't sneak in a write between
+    # our BEGIN and our UPDATE.
+    cursor.execute('BEGIN IMMEDIATE')
+
+    # Take 0.2 from Alice and give it to Bob in ONE statement:
+    # CASE picks the adjustment for each matching row
+    cursor.execute(SQL_TRANSFER_GPA,
+                   {'giver': 'Alice Johnson', 'receiver': 'Bob Smith', 'amount': 0.2})
     
-    # If both succeed, commit (save changes)
-    connection.commit()
+    # If the update succeeds, commit (save both students' new GPAs)
+    cursor.execute('COMMIT')
     print("\n✓ Transaction successful!")
     
 except sqlite3.Error as error:
     # If anything fails, rollback (undo all changes)
-    connection.rollback()
+    if connection.in_transaction:
+        cursor.execute('ROLLBACK')
     print(f"\n✗ Transaction failed: {error}")
     print("✓ All changes rolled back")
 
 print("\nAfter: ")
-cursor.execute('SELECT name, gpa FROM students WHERE name IN (?, ?)', 
-               ('Alice Johnson', 'Bob Smith'))
+cursor.execute(SQL_GPA_BY_NAMES, ('Alice Johnson', 'Bob Smith'))
 for student in cursor.fetchall():
     print(f"  {student[0]}: {student[1]}")
 
@@ -379,10 +513,9 @@ print("=" * 70)
 print("SECTION 9: MULTIPLE TABLES AND JOINS")
 print("=" * 70)
 
-# Create a courses table
-cursor.execute('DROP TABLE IF EXISTS courses')
+# Create a courses table (emptied for a clean start, like in Section 2)
 cursor.execute('''
-CREATE TABLE courses (
+CREATE TABLE IF NOT EXISTS courses (
     course_id INTEGER PRIMARY KEY AUTOINCREMENT,
     student_id INTEGER,
     course_name TEXT,
@@ -392,6 +525,16 @@ CREATE TABLE courses (
 ''')
 # FOREIGN KEY links course to a student
 
+# Index the foreign key so the JOINs below can look up a student's
+# courses directly instead of scanning the whole courses table.
+# Adding course_name and grade makes it a "covering" index: it holds
+# every courses column the JOINs select, so SQLite never has to read
+# the table rows themselves.
+cursor.execute('''
+CREATE INDEX IF NOT EXISTS idx_courses_cover
+ON courses(student_id, course_name, grade)
+''')
+
 print("✓ Created 'courses' table")
 
 # Add some courses
@@ -402,20 +545,27 @@ courses_data = [
     (3, 'History 101', 'B'),
 ]
 
-cursor.executemany('''
-INSERT INTO courses (student_id, course_name, grade)
-VALUES (?, ?, ?)
-''', courses_data)
-connection.commit()
+# Same tricks as Section 3: one transaction, one commit, and one
+# multi-row INSERT for the whole batch.
+# - defer_foreign_keys: every row is still checked, but a row that breaks
+#   a foreign key doesn't fail its INSERT right away - SQLite counts the
+#   problem and COMMIT fails if any remain. This lets rows arrive in any
+#   order within the transaction. (It only matters once foreign keys are
+#   turned on - see tip 6 in Section 13.)
+# (For very large loads into a table that already holds data, dropping
+# its indexes first and re-creating them afterwards can be faster - but
+# that changes the schema, which is not worth it for a few rows.)
+cursor.execute('PRAGMA defer_foreign_keys = ON')
+cursor.execute('BEGIN')
+cursor.execute('DELETE FROM courses')  # clear rows left by a previous run
+cursor.execute("DELETE FROM sqlite_sequence WHERE name = 'courses'")
+insert_many(cursor, 'courses', ('student_id', 'course_name', 'grade'), courses_data)
+cursor.execute('COMMIT')
 print("✓ Added sample courses")
 
 # INNER JOIN: Get students with their courses
 print("\n--- Students and Their Courses (INNER JOIN) ---")
-cursor.execute('''
-SELECT students.name, courses.course_name, courses.grade
-FROM students
-INNER JOIN courses ON students.id = courses.student_id
-''')
+cursor.execute(SQL_COURSES_INNER_JOIN)
 # INNER JOIN only shows students who have courses
 
 for name, course, grade in cursor.fetchall():
@@ -423,11 +573,7 @@ for name, course, grade in cursor.fetchall():
 
 # LEFT JOIN: Get ALL students, even those without courses
 print("\n--- All Students and Their Courses (LEFT JOIN) ---")
-cursor.execute('''
-SELECT students.name, courses.course_name, courses.grade
-FROM students
-LEFT JOIN courses ON students.id = courses.student_id
-''')
+cursor.execute(SQL_COURSES_LEFT_JOIN)
 # LEFT JOIN shows all students; course columns are NULL if no match
 
 for name, course, grade in cursor.fetchall():
@@ -443,17 +589,22 @@ print("=" * 70)
 print("SECTION 10: DATABASE INTROSPECTION")
 print("=" * 70)
 
+# Read the table list ONCE: sqlite_master lists every table in the
+# database. Both the "does it exist?" check and the table listing below
+# are answered from this one result in Python.
+table_names = [name for (name,) in cursor.execute(SQL_LIST_TABLES)]
+
 # Check if a table exists
-cursor.execute('''
-SELECT name FROM sqlite_master 
-WHERE type='table' AND name='students'
-''')
-table_exists = cursor.fetchone() is not None
+table_exists = 'students' in table_names
 print(f"\n✓ Table 'students' exists: {table_exists}")
 
 # Get table structure (columns info)
+# pragma_table_info() is the table-valued form of PRAGMA table_info,
+# so it can be queried with a normal SELECT - and, unlike the PRAGMA,
+# the table name can be a ? placeholder. The same prepared statement
+# can then be reused to inspect any table.
 print("\n--- Table Structure ---")
-cursor.execute('PRAGMA table_info(students)')
+cursor.execute(SQL_TABLE_INFO, ('students',))
 columns = cursor.fetchall()
 
 for col in columns:
@@ -467,10 +618,8 @@ for col in columns:
 
 # List all tables in database
 print("--- All Tables in Database ---")
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-tables = cursor.fetchall()
-for table in tables:
-    print(f"  - {table[0]}")
+for table_name in table_names:
+    print(f"  - {table_name}")
 
 print()
 
@@ -484,11 +633,7 @@ print("=" * 70)
 # Example 1: Duplicate unique value
 print("\n--- Trying to insert duplicate email ---")
 try:
-    cursor.execute('''
-    INSERT INTO students (name, email, age, gpa)
-    VALUES (?, ?, ?, ?)
-    ''', ('Another Alice', 'alice@email.com', 21, 3.5))
-    connection.commit()
+    cursor.execute(SQL_INSERT_STUDENT, ('Another Alice', 'alice@email.com', 21, 3.5))
 except sqlite3.IntegrityError as error:
     print(f"✗ Error: {error}")
     print("  (Email must be unique!)")
@@ -504,7 +649,7 @@ except sqlite3.OperationalError as error:
 # General error handling pattern
 print("\n--- Safe Query Pattern ---")
 try:
-    cursor.execute('SELECT * FROM students WHERE age = ?', (20,))
+    cursor.execute(SQL_STUDENTS_AGE_EQ, (20,))
     results = cursor.fetchall()
     print(f"✓ Found {len(results)} student(s)")
 except sqlite3.Error as error:
@@ -519,18 +664,28 @@ print("=" * 70)
 print("SECTION 12: CONTEXT MANAGERS")
 print("=" * 70)
 
-# The 'with' statement automatically commits or rolls back
-print("\n--- Using 'with' for automatic commit ---")
-
-with sqlite3.connect('my_database.db') as conn:
-    cur = conn.cursor()
-    cur.execute('SELECT COUNT(*) FROM students')
-    count = cur.fetchone()[0]
+# A connection is a context manager: 'with connection:' commits when the
+# block ends, or rolls back if an error occurs. BUT it only manages the
+# transactions Python opens for you - and our connection is in autocommit
+# mode (Section 1), where Python opens none. Every statement inside the
+# block is saved as soon as it runs, so there is nothing to commit, and
+# an error does NOT undo the earlier statements.
+#
+# With default transaction handling the block works as advertised:
+#     with sqlite3.connect('my_database.db') as conn:
+#         conn.execute(...)  # committed at the end, rolled back on error
+# (That opens a second connection, which costs extra file opens.)
+# In autocommit mode, get all-or-nothing behavior with explicit
+# BEGIN / COMMIT / ROLLBACK instead, as in Section 8.
+print("\n--- 'with connection:' in autocommit mode ---")
+
+with connection:
+    cursor.execute(SQL_COUNT_STUDENTS)
+    count = cursor.fetchone()[0]
     print(f"✓ Total students: {count}")
-    # Automatically commits when block ends (if no error)
-    # Automatically rolls back if an error occurs
+    # NOTE: 'with' does NOT close the connection - that happens in CLEANUP
 
-print("✓ Connection auto-committed and closed")
+print("✓ Block finished - nothing to commit in autocommit mode (connection stays open)")
 
 print()
 
@@ -548,15 +703,25 @@ print("""
    
 2. Commit your changes:
    - After INSERT, UPDATE, DELETE operations
-   - Use connection.commit()
+   - With default transaction handling, use connection.commit()
+   - In autocommit mode commit() does nothing - start and end
+     transactions yourself:
+     cursor.execute('BEGIN IMMEDIATE') ... cursor.execute('COMMIT')
    
 3. Close connections when done:
    - cursor.close()
    - connection.close()
-   - Or use 'with' statement
+   - Note: 'with connection:' does not close the connection
    
-4. Use executemany() for bulk inserts:
-   - Much faster than multiple execute() calls
+4. Use bulk inserts instead of one execute() per row:
+   - executemany() is the simple choice: it reuses one prepared
+     statement, but still runs the INSERT once per row
+   - A multi-row INSERT ... VALUES (?, ?), (?, ?), ... (insert_many()
+     in Section 3) adds many rows in one statement - faster for big
+     batches, but rows x columns must stay under the ? placeholder
+     limit (999 on SQLite before 3.32), so send it in chunks
+   - Either way, wrap the batch in BEGIN ... COMMIT so it is committed
+     once (and, with the default rollback journal, flushed to disk once)
    
 5. Check rowcount after UPDATE/DELETE:
    - Verify operations affected expected number of rows
@@ -572,10 +737,12 @@ print("""
    - Prevents accidentally returning millions of rows
    
 9. Create indexes for frequently queried columns:
-   cursor.execute('CREATE INDEX idx_email ON students(email)')
+   cursor.execute('CREATE INDEX idx_students_gpa ON students(gpa)')
+   - UNIQUE and PRIMARY KEY columns are already indexed automatically
    
 10. Use row_factory for easier column access:
-    connection.row_factory = sqlite3.Row
+    cursor.row_factory = sqlite3.Row       # just this cursor
+    connection.row_factory = sqlite3.Row   # every new cursor
 """)
 
 # =============================================================================
@@ -585,6 +752,10 @@ print("=" * 70)
 print("CLEANUP")
 print("=" * 70)
 
+# Let SQLite refresh the statistics its query planner uses to choose
+# indexes. This is cheap - tables whose stats are up to date are skipped.
+cursor.execute('PRAGMA optimize')
+
 cursor.close()
 connection.close()
 print("\n✓ Cursor closed")
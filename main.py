@@ -1,36 +1,15 @@
-import sqlite3
 import os 
 import time 
 from datetime import datetime
 import logging
 
+import schema
 
-connection = sqlite3.connect('5.db')
+
+connection = schema.init_schema('5.db')
 cursor = connection.cursor()
 
-# Creating colleges table
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS colleges(
-               CollegeID INTEGER PRIMARY KEY AUTOINCREMENT,
-               CollegeName TEXT NOT NULL,
-               DeanID INTEGER,
-               FOREIGN KEY (DeanID) REFERENCES professors(ProfessorID)
-                )''')
-
-# END
-
-# # Creating departments table
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS departments(
-    DeptID INTEGER PRIMARY KEY,
-    DeptName TEXT NOT NULL,
-    CollegeID INTEGER NOT NULL,
-    DeptHeadID INTEGER NOT NULL,
-    FOREIGN KEY (CollegeID) REFERENCES colleges(CollegeID),
-    FOREIGN KEY (DeptHeadID) REFERENCES professors(ProfessorID)
-)
-''')
-# # END
+# Tables still being drafted; once finished they move into schema.SCHEMA_DDL
 
 # # Creating students table
 # cursor.execute('''CREATE TABLE IF NOT EXISTS students(
@@ -49,19 +28,6 @@ CREATE TABLE IF NOT EXISTS departments(
 #                )''')
 # # END
 
-# Creating professors table
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS professors(
-               ProfessorID INTEGER PRIMARY KEY AUTOINCREMENT,
-               FirstName TEXT NOT NULL,
-               LastName TEXT NOT NULL,
-               DateOfBirth DATE NOT NULL,
-               CHECK ((strftime('%F') - DateOfBirth) >= 18),
-               PhoneNumber TEXT UNIQUE NOT NULL,
-               OfficeLocation TEXT NOT NULL)''')
-
-# END
-
 # # Creating staff table
 # cursor.execute('''CREATE TABLE IF NOT EXISTS staff(
 #                 StaffID INTEGER PRIMARY KEY,
@@ -161,4 +127,5 @@ CREATE TABLE IF NOT EXISTS professors(
 
 # Creating fee payments table
 connection.commit()
+cursor.execute('PRAGMA optimize')
 connection.close()
\ No newline at end of file
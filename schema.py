@@ -0,0 +1,68 @@
+import sqlite3
+
+PRAGMAS = '''
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+PRAGMA mmap_size = 268435456;
+'''
+
+# Creating colleges, departments and professors tables
+SCHEMA_DDL = '''
+CREATE TABLE IF NOT EXISTS colleges(
+               CollegeID INTEGER PRIMARY KEY AUTOINCREMENT,
+               CollegeName TEXT NOT NULL,
+               DeanID INTEGER,
+               FOREIGN KEY (DeanID) REFERENCES professors(ProfessorID)
+                );
+
+CREATE TABLE IF NOT EXISTS departments(
+    DeptID INTEGER PRIMARY KEY,
+    DeptName TEXT NOT NULL,
+    CollegeID INTEGER NOT NULL,
+    DeptHeadID INTEGER NOT NULL,
+    FOREIGN KEY (CollegeID) REFERENCES colleges(CollegeID),
+    FOREIGN KEY (DeptHeadID) REFERENCES professors(ProfessorID)
+);
+
+CREATE TABLE IF NOT EXISTS professors(
+               ProfessorID INTEGER PRIMARY KEY AUTOINCREMENT,
+               FirstName TEXT NOT NULL,
+               LastName TEXT NOT NULL,
+               DateOfBirth DATE NOT NULL,
+               PhoneNumber TEXT UNIQUE NOT NULL,
+               OfficeLocation TEXT NOT NULL);
+
+-- Professors must be at least 18. SQLite rejects date('now') inside a
+-- CHECK constraint (it is non-deterministic), so the rule is enforced by
+-- triggers; date('now', '-18 years') is evaluated once per statement.
+CREATE TRIGGER IF NOT EXISTS professors_min_age_insert
+BEFORE INSERT ON professors
+WHEN NEW.DateOfBirth > date('now', '-18 years')
+BEGIN
+    SELECT RAISE(ABORT, 'professor must be at least 18 years old');
+END;
+
+CREATE TRIGGER IF NOT EXISTS professors_min_age_update
+BEFORE UPDATE OF DateOfBirth ON professors
+WHEN NEW.DateOfBirth > date('now', '-18 years')
+BEGIN
+    SELECT RAISE(ABORT, 'professor must be at least 18 years old');
+END;
+'''
+
+
+def configure(conn):
+    conn.executescript(PRAGMAS)
+
+
+def init(conn):
+    conn.executescript(SCHEMA_DDL)
+
+
+def init_schema(db_path):
+    connection = sqlite3.connect(db_path)
+    configure(connection)
+    init(connection)
+    return connection
@@ -1,15 +1,20 @@
 import sqlite3
+import sys
 
-connection = sqlite3.connect('test.db')
-cursor = connection.cursor()
+import schema
 
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS colleges(
-               CollegeID INTEGER PRIMARY KEY AUTOINCREMENT,
-               CollegeName TEXT NOT NULL,
-               DeanID INTEGER,
-               FOREIGN KEY (DeanID) REFERENCES professors(ProfessorID)
-                )''')
+if '--scratch' in sys.argv:
+    # Throwaway run: build the schema in memory and write a fresh copy to
+    # test_scratch.db with backup(). This REPLACES test_scratch.db
+    # entirely, so never point it at a database you want to keep.
+    connection = sqlite3.connect(':memory:')
+    schema.init(connection)
+    scratch = sqlite3.connect('test_scratch.db')
+    connection.backup(scratch)
+    scratch.close()
+else:
+    # Add any missing tables to test.db, keeping the rows already in it
+    connection = schema.init_schema('test.db')
+    connection.commit()
 
-connection.commit()
 connection.close()
\ No newline at end of file